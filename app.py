@@ -1,8 +1,13 @@
 import datetime as dt
-import math
-from typing import Dict, Tuple
+import heapq
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, Final, NamedTuple, Tuple
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -96,12 +101,23 @@ PRODUCT_CONFIGS = {
 }
 
 
+BASELINE_YIELD = 85
+BASELINE_THROUGHPUT = 100
+BASELINE_BUG_COUNT = 25
+
+PRODUCT_CAT: Final = pd.CategoricalDtype(list(PRODUCT_CONFIGS), ordered=True)
+TASK_TYPE_CAT: Final = pd.CategoricalDtype(
+    ["component", "software", "factory", "validation", "milestone"]
+)
+
+
+@st.cache_data(max_entries=256)
 def compute_allocation_delays(yield_percent: int) -> Dict[str, int]:
     if yield_percent >= 70:
         return {product: 0 for product in PRODUCT_CONFIGS}
 
-    shortage_factor = (70 - yield_percent) / 70
-    base_delay = int(math.ceil(shortage_factor * 28))
+    shortage = 70 - yield_percent
+    base_delay = -(-(shortage * 28) // 70)
     return {
         "MacBook Pro": 0,
         "iPad Pro": base_delay,
@@ -109,101 +125,182 @@ def compute_allocation_delays(yield_percent: int) -> Dict[str, int]:
     }
 
 
-def build_product_tasks(product_name: str) -> Dict[str, dict]:
-    tasks = {}
-    for name, duration, deps, task_type in SHARED_TASKS:
-        tasks[name] = {
-            "duration": duration,
-            "deps": list(deps),
-            "type": task_type,
-        }
+@dataclass(slots=True, frozen=True)
+class Task:
+    duration: int
+    deps: Tuple[str, ...]
+    type: str
 
-    for name, duration, deps, task_type in PRODUCT_CONFIGS[product_name]["unique_tasks"]:
-        tasks[name] = {
-            "duration": duration,
-            "deps": list(deps),
-            "type": task_type,
-        }
 
-    component_tasks = [task for task, meta in tasks.items() if meta["type"] == "component"]
-    software_tasks = [task for task, meta in tasks.items() if meta["type"] == "software"]
+def _build_templates() -> Dict[str, Dict[str, Task]]:
+    templates = {}
+    for product_name, config in PRODUCT_CONFIGS.items():
+        tasks = {}
+        for name, duration, deps, task_type in SHARED_TASKS + config["unique_tasks"]:
+            tasks[name] = Task(duration=duration, deps=tuple(deps), type=task_type)
+
+        component_tasks, software_tasks = [], []
+        for task, meta in tasks.items():
+            if meta.type == "component":
+                component_tasks.append(task)
+            elif meta.type == "software":
+                software_tasks.append(task)
+
+        tasks["Factory Build"] = Task(
+            duration=14,
+            deps=tuple(component_tasks),
+            type="factory",
+        )
+        tasks["Validation & Launch Readiness"] = Task(
+            duration=10,
+            deps=("Factory Build", *software_tasks),
+            type="validation",
+        )
+        tasks["Ship"] = Task(
+            duration=0,
+            deps=("Validation & Launch Readiness",),
+            type="milestone",
+        )
+        templates[product_name] = tasks
+    return templates
+
+
+_TEMPLATE_BY_PRODUCT = _build_templates()
+
+
+def build_product_tasks(product_name: str) -> Dict[str, Task]:
+    return _TEMPLATE_BY_PRODUCT[product_name]
 
-    tasks["Factory Build"] = {
-        "duration": 14,
-        "deps": component_tasks,
-        "type": "factory",
-    }
-    tasks["Validation & Launch Readiness"] = {
-        "duration": 10,
-        "deps": ["Factory Build"] + software_tasks,
-        "type": "validation",
-    }
-    tasks["Ship"] = {
-        "duration": 0,
-        "deps": ["Validation & Launch Readiness"],
-        "type": "milestone",
-    }
-    return tasks
 
+class Constraints(NamedTuple):
+    throughput: int
+    bug_delay: int
+    na_delay: int
+    m5_delay: int
 
-def apply_constraints(
-    tasks: Dict[str, dict],
+
+def compute_constraints(
     product_name: str,
     yield_percent: int,
     throughput: int,
     bug_count: int,
-) -> Tuple[Dict[str, dict], Dict[str, int], int]:
+) -> Tuple[Constraints, Dict[str, int]]:
     allocation_delays = compute_allocation_delays(yield_percent)
-    factory_multiplier = 100 / max(1, throughput)
-    bug_delay = int(math.ceil(bug_count / 12))
-    na_delay = int(math.ceil(max(0, 90 - throughput) / 10)) * 2
-
-    updated = {}
-    for task_name, meta in tasks.items():
-        duration = meta["duration"]
-        if meta["type"] == "factory":
-            duration = math.ceil(duration * factory_multiplier)
-        if meta["type"] == "software":
-            duration += bug_delay
-        if task_name == "Neural Accelerator":
-            duration += na_delay
-        if task_name == "M5 Chip":
-            duration += allocation_delays.get(product_name, 0)
-
-        updated[task_name] = {
-            **meta,
-            "duration": max(0, int(duration)),
-        }
-
-    return updated, allocation_delays, na_delay
-
+    constraints = Constraints(
+        throughput=max(1, throughput),
+        bug_delay=-(-bug_count // 12),
+        na_delay=-(-max(0, 90 - throughput) // 10) * 2,
+        m5_delay=allocation_delays.get(product_name, 0),
+    )
+    return constraints, allocation_delays
+
+
+class CompiledDAG(NamedTuple):
+    names: Tuple[str, ...]
+    types: Tuple[str, ...]
+    base_durations: np.ndarray
+    factory_idx: np.ndarray
+    software_idx: np.ndarray
+    na_idx: int
+    m5_idx: int
+    ship_idx: int
+    cpm: Callable[[np.ndarray], Tuple[tuple, tuple]]
+
+
+_DAG_CACHE: Dict[str, CompiledDAG] = {}
+
+
+def _generate_cpm(parents_by_node: Tuple[Tuple[int, ...], ...]) -> Callable:
+    lines = ["def _cpm(durations):"]
+    for node, parents in enumerate(parents_by_node):
+        if not parents:
+            start = "0"
+        elif len(parents) == 1:
+            start = f"f{parents[0]}"
+        else:
+            start = "max({})".format(", ".join(f"f{parent}" for parent in parents))
+        lines.append(f"    s{node} = {start}")
+        lines.append(f"    f{node} = s{node} + durations[{node}]")
+    starts = ", ".join(f"s{node}" for node in range(len(parents_by_node)))
+    finishes = ", ".join(f"f{node}" for node in range(len(parents_by_node)))
+    lines.append(f"    return ({starts},), ({finishes},)")
+
+    namespace: dict = {}
+    exec(compile("\n".join(lines), "<cpm>", "exec"), namespace)
+    return namespace["_cpm"]
+
+
+def _compile_dag(product_name: str) -> CompiledDAG:
+    dag = _DAG_CACHE.get(product_name)
+    if dag is not None:
+        return dag
+
+    tasks = build_product_tasks(product_name)
+    indegree = {task: len(meta.deps) for task, meta in tasks.items()}
+    children = defaultdict(list)
+    for task, meta in tasks.items():
+        for dep in meta.deps:
+            children[dep].append(task)
 
-def compute_cpm(tasks: Dict[str, dict]) -> Tuple[Dict[str, int], Dict[str, int]]:
-    remaining = {task: set(meta["deps"]) for task, meta in tasks.items()}
     order = []
+    ready = [task for task, degree in indegree.items() if degree == 0]
+    heapq.heapify(ready)
+    while ready:
+        task = heapq.heappop(ready)
+        order.append(task)
+        for child in children[task]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                heapq.heappush(ready, child)
+
+    if len(order) != len(tasks):
+        raise ValueError("Dependency cycle detected in tasks.")
+
+    index = {task: position for position, task in enumerate(order)}
+    types = tuple(tasks[task].type for task in order)
+    dag = CompiledDAG(
+        names=tuple(order),
+        types=types,
+        base_durations=np.asarray(
+            [tasks[task].duration for task in order], dtype=np.int32
+        ),
+        factory_idx=np.flatnonzero([task_type == "factory" for task_type in types]),
+        software_idx=np.flatnonzero([task_type == "software" for task_type in types]),
+        na_idx=index.get("Neural Accelerator", -1),
+        m5_idx=index.get("M5 Chip", -1),
+        ship_idx=index["Ship"],
+        cpm=_generate_cpm(
+            tuple(tuple(index[dep] for dep in tasks[task].deps) for task in order)
+        ),
+    )
+    _DAG_CACHE[product_name] = dag
+    return dag
 
-    while remaining:
-        ready = [task for task, deps in remaining.items() if not deps]
-        if not ready:
-            raise ValueError("Dependency cycle detected in tasks.")
-        for task in sorted(ready):
-            order.append(task)
-            del remaining[task]
-            for deps in remaining.values():
-                deps.discard(task)
-
-    earliest_start = {}
-    earliest_finish = {}
-    for task in order:
-        deps = tasks[task]["deps"]
-        start = max((earliest_finish[dep] for dep in deps), default=0)
-        finish = start + tasks[task]["duration"]
-        earliest_start[task] = start
-        earliest_finish[task] = finish
 
-    return earliest_start, earliest_finish
+def _adjusted_durations(dag: CompiledDAG, constraints: Constraints) -> np.ndarray:
+    durations = dag.base_durations.copy()
+    durations[dag.factory_idx] = -(
+        -(durations[dag.factory_idx] * 100) // constraints.throughput
+    )
+    durations[dag.software_idx] += constraints.bug_delay
+    if dag.na_idx >= 0:
+        durations[dag.na_idx] += constraints.na_delay
+    if dag.m5_idx >= 0:
+        durations[dag.m5_idx] += constraints.m5_delay
+    np.maximum(durations, 0, out=durations)
+    return durations
+
+
+def compute_cpm(dag: CompiledDAG, constraints: Constraints) -> Tuple[np.ndarray, np.ndarray]:
+    durations = _adjusted_durations(dag, constraints)
+    starts, finishes = dag.cpm(durations)
+    return (
+        np.asarray(starts, dtype=np.int32),
+        np.asarray(finishes, dtype=np.int32),
+    )
 
 
+@st.cache_data(max_entries=256)
 def build_schedule(
     product_name: str,
     start_date: dt.date,
@@ -211,120 +308,302 @@ def build_schedule(
     throughput: int,
     bug_count: int,
 ):
-    base_tasks = build_product_tasks(product_name)
-    tasks, allocation_delays, na_delay = apply_constraints(
-        base_tasks,
+    dag = _compile_dag(product_name)
+    constraints, allocation_delays = compute_constraints(
         product_name,
         yield_percent,
         throughput,
         bug_count,
     )
-    earliest_start, earliest_finish = compute_cpm(tasks)
+    earliest_start, earliest_finish = compute_cpm(dag, constraints)
+    start64 = np.datetime64(start_date, "D")
 
-    task_rows = []
-    for task, meta in tasks.items():
-        task_rows.append(
-            {
-                "product": product_name,
-                "task": task,
-                "start": start_date + dt.timedelta(days=earliest_start[task]),
-                "end": start_date + dt.timedelta(days=earliest_finish[task]),
-                "duration": meta["duration"],
-                "type": meta["type"],
-            }
-        )
-
-    schedule = pd.DataFrame(task_rows)
-    ship_days = earliest_finish["Ship"]
+    schedule = pd.DataFrame(
+        {
+            "product": pd.Categorical(
+                [product_name] * len(dag.names), dtype=PRODUCT_CAT
+            ),
+            "task": list(dag.names),
+            "start": start64 + earliest_start.astype("timedelta64[D]"),
+            "end": start64 + earliest_finish.astype("timedelta64[D]"),
+            "duration": earliest_finish - earliest_start,
+            "type": pd.Categorical(dag.types, dtype=TASK_TYPE_CAT),
+        }
+    )
+    ship_days = int(earliest_finish[dag.ship_idx])
     ship_date = start_date + dt.timedelta(days=ship_days)
 
-    return schedule, ship_date, ship_days, allocation_delays, na_delay
+    return schedule, ship_date, ship_days, allocation_delays, constraints.na_delay
 
 
-def confidence_score(yield_percent: int, throughput: int, bug_count: int, delay_days: int) -> int:
-    score = 100
-    if yield_percent < 70:
-        score -= (70 - yield_percent) * 1.2 + 10
-    else:
-        score -= max(0, 85 - yield_percent) * 0.4
-
-    score -= max(0, 100 - throughput) * 0.4
-    score -= bug_count * 0.2
-    score -= max(0, delay_days) * 0.5
-    return max(0, min(100, int(round(score))))
-
-
-def confidence_band(score: int) -> Tuple[str, str]:
-    if score >= 80:
-        return "Green", "#2ecc71"
-    if score >= 55:
-        return "Yellow", "#f1c40f"
-    return "Red", "#e74c3c"
-
-
-st.title("Nexus: M5 Launch Readiness Simulator")
-st.caption(
-    "Model how supply constraints cascade across MacBook Pro, iPad Pro, and Vision Pro launch windows."
-)
+@st.cache_data(max_entries=256)
+def _build_baseline(product_name: str, start_date: dt.date) -> int:
+    _, _, ship_days, _, _ = build_schedule(
+        product_name,
+        start_date,
+        BASELINE_YIELD,
+        BASELINE_THROUGHPUT,
+        BASELINE_BUG_COUNT,
+    )
+    return ship_days
 
-with st.sidebar:
-    st.header("Constraint Sliders")
-    yield_percent = st.slider("M5 Chip Yield (%)", 40, 100, 85, 1)
-    throughput = st.slider("Factory Throughput (%)", 60, 120, 100, 1)
-    bug_count = st.slider("Software Stability (Open Bugs)", 0, 200, 45, 1)
-    start_date = st.date_input("Program Start Date", dt.date.today())
 
-baseline_yield = 85
-baseline_throughput = 100
-baseline_bug_count = 25
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=len(PRODUCT_CONFIGS))
 
-baseline = {}
-current = {}
-logs = []
-allocation_snapshot = compute_allocation_delays(yield_percent)
 
-for product in PRODUCT_CONFIGS:
-    _, _, baseline_days, _, _ = build_schedule(
-        product, start_date, baseline_yield, baseline_throughput, baseline_bug_count
-    )
+def _build_product_state(
+    product_name: str,
+    start_date: dt.date,
+    yield_percent: int,
+    throughput: int,
+    bug_count: int,
+) -> Tuple[int, dict]:
+    baseline_days = _build_baseline(product_name, start_date)
     schedule, ship_date, ship_days, _, na_delay = build_schedule(
-        product, start_date, yield_percent, throughput, bug_count
+        product_name, start_date, yield_percent, throughput, bug_count
     )
-    baseline[product] = baseline_days
-    current[product] = {
+    state = {
         "schedule": schedule,
         "ship_date": ship_date,
         "ship_days": ship_days,
         "delay_days": ship_days - baseline_days,
         "na_delay": na_delay,
     }
+    return baseline_days, state
+
+
+def _simulate(
+    start_date: dt.date, yield_percent: int, throughput: int, bug_count: int
+) -> Tuple[Dict[str, int], Dict[str, dict], list]:
+    baseline = {}
+    current = {}
+    logs = []
+    allocation_snapshot = compute_allocation_delays(yield_percent)
+
+    build_state = partial(
+        _build_product_state,
+        start_date=start_date,
+        yield_percent=yield_percent,
+        throughput=throughput,
+        bug_count=bug_count,
+    )
+    for product, (baseline_days, state) in zip(
+        PRODUCT_CONFIGS, _get_executor().map(build_state, PRODUCT_CONFIGS)
+    ):
+        baseline[product] = baseline_days
+        current[product] = state
 
-if yield_percent < 70:
-    if allocation_snapshot["iPad Pro"] > 0:
+    if yield_percent < 70:
+        if allocation_snapshot["iPad Pro"] > 0:
+            logs.append(
+                f"Warning: M5 chip yield below 70%; iPad Pro launch pushed by {allocation_snapshot['iPad Pro']} days."
+            )
+        if allocation_snapshot["Vision Pro"] > 0:
+            logs.append(
+                f"Warning: M5 chip yield below 70%; Vision Pro launch pushed by {allocation_snapshot['Vision Pro']} days."
+            )
+        logs.append("Action: Prioritized MacBook Pro allocation to protect revenue.")
+
+    if throughput < 85:
+        na_delay = current["Vision Pro"]["na_delay"]
+        if na_delay > 0:
+            logs.append(
+                f"Warning: Neural Accelerator throughput constraint adds {na_delay} days; Vision Pro launch pushed by {current['Vision Pro']['delay_days']} days."
+            )
+        logs.append("Risk: Factory throughput below 85% is elongating final assembly.")
+
+    if bug_count > 90:
         logs.append(
-            f"Warning: M5 chip yield below 70%; iPad Pro launch pushed by {allocation_snapshot['iPad Pro']} days."
+            f"Risk: Software stability degraded ({bug_count} open bugs); shift QA staffing to reduce launch exposure."
         )
-    if allocation_snapshot["Vision Pro"] > 0:
-        logs.append(
-            f"Warning: M5 chip yield below 70%; Vision Pro launch pushed by {allocation_snapshot['Vision Pro']} days."
+
+    if not logs:
+        logs.append("On track: No critical constraints detected; launch windows remain within baseline.")
+
+    return baseline, current, logs
+
+
+BAND_COLORS: Final[Dict[str, str]] = {
+    "Green": "#2ecc71",
+    "Yellow": "#f1c40f",
+    "Red": "#e74c3c",
+}
+
+
+def _confidence_kernel(
+    yield_deduction: float,
+    throughput_deduction: float,
+    bug_deduction: float,
+    delays: np.ndarray,
+) -> np.ndarray:
+    scores = (
+        100.0
+        - yield_deduction
+        - throughput_deduction
+        - bug_deduction
+        - np.maximum(delays, 0) * 0.5
+    )
+    return np.rint(np.minimum(np.maximum(scores, 0.0), 100.0)).astype(np.int32)
+
+
+try:
+    from numba import njit
+
+    _confidence_kernel = njit(cache=True)(_confidence_kernel)
+except ImportError:
+    # numba is optional; the plain NumPy kernel is already vectorized.
+    pass
+
+
+def confidence_scores(
+    yield_percent: int, throughput: int, bug_count: int, delays: np.ndarray
+) -> np.ndarray:
+    if yield_percent < 70:
+        yield_deduction = (70 - yield_percent) * 1.2 + 10
+    else:
+        yield_deduction = max(0, 85 - yield_percent) * 0.4
+
+    throughput_deduction = max(0, 100 - throughput) * 0.4
+    bug_deduction = bug_count * 0.2
+
+    return _confidence_kernel(
+        float(yield_deduction), float(throughput_deduction), float(bug_deduction), delays
+    )
+
+
+def confidence_bands(scores: np.ndarray) -> np.ndarray:
+    return np.select([scores >= 80, scores >= 55], ["Green", "Yellow"], "Red")
+
+
+DEPENDENCY_DOT: Final[str] = """
+digraph {
+    rankdir=LR;
+    node [shape=box style="rounded,filled" fontname="Helvetica" fontsize=10 fillcolor="#11151c" color="#1f2732" fontcolor="#e6e6e6"];
+    M5 [label="M5 Chip" fillcolor="#a81d1d" color="#ff4d4d" fontcolor="#ffffff"];
+    Neural [label="Neural Accelerator"];
+    Display [label="Liquid Glass Display"];
+    Mac [label="MacBook Pro" fillcolor="#0f172a"];
+    iPad [label="iPad Pro" fillcolor="#0f172a"];
+    Vision [label="Vision Pro" fillcolor="#0f172a"];
+    Thermal [label="Thermal System"];
+    macOS [label="macOS M5 Optimization"];
+    iPadOS [label="M5-optimized iPadOS"];
+    Pencil [label="Pencil Pro Calibration"];
+    R1 [label="R1 Sensor"];
+    VisionOS [label="VisionOS Spatial UX"];
+
+    M5 -> Mac;
+    M5 -> iPad;
+    M5 -> Vision;
+    Neural -> Mac;
+    Neural -> iPad;
+    Neural -> Vision;
+    Display -> Mac;
+    Display -> iPad;
+    Display -> Vision;
+    Thermal -> Mac;
+    macOS -> Mac;
+    iPadOS -> iPad;
+    Pencil -> iPad;
+    R1 -> Vision;
+    VisionOS -> Vision;
+}
+"""
+
+
+@st.cache_resource
+def _make_gantt_spec() -> alt.Chart:
+    return (
+        alt.Chart()
+        .mark_bar(cornerRadius=6)
+        .encode(
+            x=alt.X("Start:T", title=""),
+            x2="End:T",
+            y=alt.Y("Product:N", title="", sort=list(PRODUCT_CONFIGS.keys())),
+            color=alt.Color(
+                "Product:N",
+                scale=alt.Scale(range=["#00d4ff", "#ffb020", "#8b5cf6"]),
+                legend=None,
+            ),
+            tooltip=["Product:N", "Ship Date:N"],
         )
-    logs.append("Action: Prioritized MacBook Pro allocation to protect revenue.")
+        .properties(height=180)
+        .configure_view(stroke=None)
+        .configure_axis(labelColor="#9aa4b2", gridColor="#1f2732", domainColor="#1f2732")
+    )
 
-if throughput < 85:
-    na_delay = current["Vision Pro"]["na_delay"]
-    if na_delay > 0:
-        logs.append(
-            f"Warning: Neural Accelerator throughput constraint adds {na_delay} days; Vision Pro launch pushed by {current['Vision Pro']['delay_days']} days."
+
+@st.cache_resource
+def _make_heatmap_spec() -> alt.LayerChart:
+    heatmap = (
+        alt.Chart()
+        .mark_rect(cornerRadius=8)
+        .encode(
+            x=alt.X(
+                "Product:N",
+                title="",
+                sort=list(PRODUCT_CONFIGS.keys()),
+                axis=alt.Axis(labelAngle=0, labelColor="#9aa4b2"),
+            ),
+            y=alt.Y(
+                "Band:N",
+                title="",
+                axis=None,
+                sort=["Launch Confidence"],
+                scale=alt.Scale(paddingInner=0, paddingOuter=0),
+            ),
+            color=alt.Color("Color:N", scale=None, legend=None),
+            tooltip=["Product:N", "Level:N", "Score:Q"],
         )
-    logs.append("Risk: Factory throughput below 85% is elongating final assembly.")
+    )
+
+    heatmap_text = (
+        alt.Chart()
+        .mark_text(
+            color="#0b0c10",
+            font="Avenir Next",
+            fontSize=14,
+            fontWeight="bold",
+        )
+        .encode(
+            x=alt.X("Product:N", sort=list(PRODUCT_CONFIGS.keys())),
+            y=alt.Y("Band:N", sort=["Launch Confidence"]),
+            text=alt.Text("Score:Q", format=".0f"),
+        )
+    )
 
-if bug_count > 90:
-    logs.append(
-        f"Risk: Software stability degraded ({bug_count} open bugs); shift QA staffing to reduce launch exposure."
+    return (
+        (heatmap + heatmap_text)
+        .properties(height=alt.Step(60))
+        .configure_view(stroke=None)
+        .configure_axis(
+            labelColor="#9aa4b2",
+            domainColor="#1f2732",
+        )
     )
 
-if not logs:
-    logs.append("On track: No critical constraints detected; launch windows remain within baseline.")
+
+st.title("Nexus: M5 Launch Readiness Simulator")
+st.caption(
+    "Model how supply constraints cascade across MacBook Pro, iPad Pro, and Vision Pro launch windows."
+)
+
+with st.sidebar:
+    st.header("Constraint Sliders")
+    yield_percent = st.slider("M5 Chip Yield (%)", 40, 100, 85, 1)
+    throughput = st.slider("Factory Throughput (%)", 60, 120, 100, 1)
+    bug_count = st.slider("Software Stability (Open Bugs)", 0, 200, 45, 1)
+    start_date = st.date_input("Program Start Date", dt.date.today())
+
+inputs_key = (yield_percent, throughput, bug_count, start_date)
+if st.session_state.get("_last_inputs") == inputs_key:
+    baseline, current, logs = st.session_state["_last_results"]
+else:
+    baseline, current, logs = _simulate(start_date, yield_percent, throughput, bug_count)
+    st.session_state["_last_inputs"] = inputs_key
+    st.session_state["_last_results"] = (baseline, current, logs)
 
 metric_cols = st.columns(3)
 for idx, product in enumerate(PRODUCT_CONFIGS):
@@ -341,143 +620,44 @@ for product in PRODUCT_CONFIGS:
     gantt_rows.append(
         {
             "Product": product,
-            "Start": start_date,
-            "End": current[product]["ship_date"],
+            "Start": start_date.isoformat(),
+            "End": current[product]["ship_date"].isoformat(),
             "Ship Date": current[product]["ship_date"].strftime("%Y-%m-%d"),
         }
     )
 
-gantt_df = pd.DataFrame(gantt_rows)
-gantt_chart = (
-    alt.Chart(gantt_df)
-    .mark_bar(cornerRadius=6)
-    .encode(
-        x=alt.X("Start:T", title=""),
-        x2="End:T",
-        y=alt.Y("Product:N", title="", sort=list(PRODUCT_CONFIGS.keys())),
-        color=alt.Color(
-            "Product:N",
-            scale=alt.Scale(range=["#00d4ff", "#ffb020", "#8b5cf6"]),
-            legend=None,
-        ),
-        tooltip=["Product", "Ship Date"],
-    )
-    .properties(height=180)
-    .configure_view(stroke=None)
-    .configure_axis(labelColor="#9aa4b2", gridColor="#1f2732", domainColor="#1f2732")
-)
+gantt_chart = _make_gantt_spec().properties(data=alt.Data(values=gantt_rows))
 
 st.subheader("Launch Windows")
 st.altair_chart(gantt_chart, use_container_width=True)
 
+delays = np.array(
+    [current[product]["delay_days"] for product in PRODUCT_CONFIGS], dtype=np.int32
+)
+scores = confidence_scores(yield_percent, throughput, bug_count, delays)
+bands = confidence_bands(scores)
+
 risk_rows = []
-for product in PRODUCT_CONFIGS:
-    score = confidence_score(
-        yield_percent,
-        throughput,
-        bug_count,
-        current[product]["delay_days"],
-    )
-    band, color = confidence_band(score)
+for product, score, band in zip(PRODUCT_CONFIGS, scores, bands):
     risk_rows.append(
         {
             "Product": product,
             "Band": "Launch Confidence",
-            "Score": score,
-            "Level": band,
-            "Color": color,
+            "Score": int(score),
+            "Level": str(band),
+            "Color": BAND_COLORS[str(band)],
         }
     )
 
-risk_df = pd.DataFrame(risk_rows)
-heatmap = (
-    alt.Chart(risk_df)
-    .mark_rect(cornerRadius=8)
-    .encode(
-        x=alt.X(
-            "Product:N",
-            title="",
-            sort=list(PRODUCT_CONFIGS.keys()),
-            axis=alt.Axis(labelAngle=0, labelColor="#9aa4b2"),
-        ),
-        y=alt.Y(
-            "Band:N",
-            title="",
-            axis=None,
-            sort=["Launch Confidence"],
-            scale=alt.Scale(paddingInner=0, paddingOuter=0),
-        ),
-        color=alt.Color("Color:N", scale=None, legend=None),
-        tooltip=["Product", "Level", "Score"],
-    )
-)
-
-heatmap_text = (
-    alt.Chart(risk_df)
-    .mark_text(
-        color="#0b0c10",
-        font="Avenir Next",
-        fontSize=14,
-        fontWeight="bold",
-    )
-    .encode(
-        x=alt.X("Product:N", sort=list(PRODUCT_CONFIGS.keys())),
-        y=alt.Y("Band:N", sort=["Launch Confidence"]),
-        text=alt.Text("Score:Q", format=".0f"),
-    )
-)
-
 col_left, col_right = st.columns([1.1, 0.9], gap="large")
 with col_left:
     st.subheader("Launch Confidence Score")
-    layered_heatmap = (
-        (heatmap + heatmap_text)
-        .properties(height=alt.Step(60))
-        .configure_view(stroke=None)
-        .configure_axis(
-            labelColor="#9aa4b2",
-            domainColor="#1f2732",
-        )
-    )
+    layered_heatmap = _make_heatmap_spec().properties(data=alt.Data(values=risk_rows))
     st.altair_chart(layered_heatmap, use_container_width=True)
 
 with col_right:
     st.subheader("Dependency Map")
-    dependency_dot = """
-    digraph {
-        rankdir=LR;
-        node [shape=box style="rounded,filled" fontname="Helvetica" fontsize=10 fillcolor="#11151c" color="#1f2732" fontcolor="#e6e6e6"];
-        M5 [label="M5 Chip" fillcolor="#a81d1d" color="#ff4d4d" fontcolor="#ffffff"];
-        Neural [label="Neural Accelerator"];
-        Display [label="Liquid Glass Display"];
-        Mac [label="MacBook Pro" fillcolor="#0f172a"];
-        iPad [label="iPad Pro" fillcolor="#0f172a"];
-        Vision [label="Vision Pro" fillcolor="#0f172a"];
-        Thermal [label="Thermal System"];
-        macOS [label="macOS M5 Optimization"];
-        iPadOS [label="M5-optimized iPadOS"];
-        Pencil [label="Pencil Pro Calibration"];
-        R1 [label="R1 Sensor"];
-        VisionOS [label="VisionOS Spatial UX"];
-
-        M5 -> Mac;
-        M5 -> iPad;
-        M5 -> Vision;
-        Neural -> Mac;
-        Neural -> iPad;
-        Neural -> Vision;
-        Display -> Mac;
-        Display -> iPad;
-        Display -> Vision;
-        Thermal -> Mac;
-        macOS -> Mac;
-        iPadOS -> iPad;
-        Pencil -> iPad;
-        R1 -> Vision;
-        VisionOS -> Vision;
-    }
-    """
-    st.graphviz_chart(dependency_dot)
+    st.graphviz_chart(DEPENDENCY_DOT)
 
 st.subheader("Simulation Log")
 st.code("\n".join(logs), language="text")